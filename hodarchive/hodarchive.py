@@ -28,24 +28,125 @@ Example usage::
 
 Dependencies:
     requests - https://docs.python-requests.org
+    orjson (optional) - https://github.com/ijl/orjson - faster JSON encoding and decoding when installed
+    httpx[http2] (optional) - https://www.python-httpx.org - required by ``--http2`` to multiplex API calls over
+     HTTP/2
 """
 
 import argparse
 import csv
 import json
+import random
+import threading
 import time
-from collections import namedtuple, deque
-from typing import Any, Union, Generator, Dict, Deque
+from collections import deque
+from contextlib import nullcontext
+from functools import lru_cache
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from operator import attrgetter
+from typing import Any, Union, Generator, Dict, Deque, Iterable, Iterator, List, Optional, TypeVar
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 _HOD_ARCHIVE_URL = 'https://api.weather.com/v3/wx/hod/r1/archive'
 _HOD_ACTIVITY_URL = 'https://api.weather.com/v3/wx/hod/r1/activity'
-
-ArchiveRequest = namedtuple(
-    'ArchiveRequest',
-    ['start_date_time', 'end_date_time', 'location', 'format', 'units', 'results_location']
-)
+_POOL_MAXSIZE = 32
+_STATUS_WORKERS = 16
+_SUBMIT_WORKERS = 8
+_MAX_PENDING_SUBMISSIONS = _SUBMIT_WORKERS * 2
+_STATUS_BATCH_SIZE = 50  # job IDs per batched status request, keeping the URL well under server limits
+
+_POLL_INTERVAL = 10.0
+_MAX_POLL_INTERVAL = 60.0
+_POLL_BACKOFF = 1.5
+_JITTER = 0.1
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Cleared the first time the activity endpoint rejects a list of job IDs or returns something other than a list. Reset
+# at the start of each ``run_jobs``, so a server that rejects batching only turns it off for that run.
+_batch_status_supported = True
+
+# Seconds spent in each phase of ``run_jobs``, summed across threads. Only collected when profiling.
+_PROFILE_PHASES = ('csv_read', 'post', 'post_retry_wait', 'status_get', 'status_wait_sleep')
+_profile: Optional[Dict[str, float]] = None
+_profile_lock = threading.Lock()
+
+_T = TypeVar('_T')
+
+_KEY_STRIP_TABLE = str.maketrans('', '', '_- ')
+_KEY_MAP = {
+    'startdatetime': 'start_date_time',
+    'enddatetime': 'end_date_time',
+    'resultslocation': 'results_location'
+}
+
+
+class ArchiveRequest:
+    """ The parameters of a single HoD Archive job.
+
+    Compares, iterates, and converts with ``_asdict()`` like the ``namedtuple`` it replaces.
+    """
+    _fields = ('start_date_time', 'end_date_time', 'location', 'format', 'units', 'results_location')
+    __slots__ = _fields
+
+    def __init__(self, start_date_time: str, end_date_time: str, location: str, format: str, units: str,
+                 results_location: str):
+        self.start_date_time = start_date_time
+        self.end_date_time = end_date_time
+        self.location = location
+        self.format = format
+        self.units = units
+        self.results_location = results_location
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value!r}' for name, value in zip(self._fields, self))
+        return f'ArchiveRequest({fields})'
+
+    def __eq__(self, other):
+        if not isinstance(other, ArchiveRequest):
+            return NotImplemented
+        return _request_values(self) == _request_values(other)
+
+    def __hash__(self):
+        return hash(_request_values(self))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_request_values(self))
+
+    def _asdict(self) -> Dict[str, str]:
+        return dict(zip(self._fields, _request_values(self)))
+
+
+# HoD Archive API names for the ``ArchiveRequest`` fields
+_FIELD_MAP = {
+    'start_date_time': 'startDateTime',
+    'end_date_time': 'endDateTime',
+    'location': 'location',
+    'format': 'format',
+    'units': 'units',
+    'results_location': 'resultsLocation'
+}
+_REQUEST_BODY_KEYS = tuple(_FIELD_MAP[field] for field in ArchiveRequest._fields)
+_request_values = attrgetter(*ArchiveRequest._fields)
 
 
 class Job:
@@ -55,49 +156,217 @@ class Job:
         self.info: Dict[str, Any] = {}
 
 
+class _Http2Response:
+    """ Presents an ``httpx.Response`` as the subset of ``requests.Response`` used by this module """
+
+    def __init__(self, response: 'httpx.Response'):
+        self.url = response.url
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.content = response.content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.HTTPError(f'{self.status_code} {kind} Error: {self.reason} for url: {self.url}',
+                                     response=self)
+
+
+class _Http2Session:
+    """ Presents an HTTP/2 ``httpx.Client`` as the subset of ``requests.Session`` used by this module.
+
+    When the server negotiates HTTP/2, concurrent submissions and status checks are multiplexed over one connection.
+    Otherwise the pool falls back to as many HTTP/1.1 connections as the ``requests.Session`` would use.
+    """
+
+    def __init__(self):
+        self._client = self._new_client()  # fails fast with ImportError if the h2 package is missing
+
+    @staticmethod
+    def _new_client() -> 'httpx.Client':
+        return httpx.Client(
+            http2=True,
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_connections=_POOL_MAXSIZE, max_keepalive_connections=_POOL_MAXSIZE),
+            timeout=None  # match requests, which doesn't time out by default
+        )
+
+    def get(self, url: str, **kwargs) -> _Http2Response:
+        return self._send('GET', url, **kwargs)
+
+    def post(self, url: str, data: bytes = None, **kwargs) -> _Http2Response:
+        return self._send('POST', url, content=data, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs) -> _Http2Response:
+        # Raise transport failures as their requests equivalents, so callers only need to handle one family of errors.
+        try:
+            return _Http2Response(self._client.request(method, url, **kwargs))
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def close(self):
+        self._client.close()
+
+
+_Session = Union[requests.Session, _Http2Session]
+
+
+def _new_session(http2: bool = False) -> _Session:
+    """ Create a session that keeps connections to the HoD Archive API alive between calls
+    Args:
+        http2: Use HTTP/2 via httpx rather than ``requests``
+
+    Raises:
+        ImportError - if ``http2`` is requested but httpx with HTTP/2 support is not installed
+    """
+    if http2:
+        if httpx is None:
+            raise ImportError('HTTP/2 support requires httpx; install it with: pip install hodarchive[http2]')
+        return _Http2Session()
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE))
+    session.headers['Content-Type'] = 'application/json'
+    return session
+
+
+# Used by ``post``, ``get_status``, and ``get_statuses`` when they aren't given a session
+_session = _new_session()
+
+
 def _main():
     ap = argparse.ArgumentParser(prog='hodarchive.py')
     ap.add_argument('--api-key', metavar='KEY', help='A valid API key registered with HoD Archive', required=True)
     ap.add_argument('--jobs', metavar='JOBS.csv', help='Jobs CSV file', required=True)
+    ap.add_argument('--profile', action='store_true', help='Print the time spent in each phase when done')
+    ap.add_argument('--http2', action='store_true', help='Multiplex API calls over HTTP/2 (requires httpx[http2])')
     args = ap.parse_args()
 
-    run_jobs(args.api_key, args.jobs)
+    run_jobs(args.api_key, args.jobs, profile=args.profile, http2=args.http2)
 
 
-def run_jobs(api_key: str, jobs_file_path: str):
+def run_jobs(api_key: str, jobs_file_path: str, profile: bool = False, http2: bool = False):
     """ Run all jobs from the CSV identified by ``jobs_file_path``
     Args:
         api_key: A valid API key registered with HoD Archive
         jobs_file_path: A CSV with rows defining HoD Archive jobs to be submitted. Each row should always contain a
          ``startDateTime``, ``endDateTime``, ``location``, ``format``, ``units``, and ``resultsLocation``.
+        profile: Print the time spent reading the CSV, submitting jobs, and polling their status when done
+        http2: Send all API calls over HTTP/2 via httpx, which must be installed with HTTP/2 support
+
+    ``run_jobs`` is not reentrant: per-run state such as profiling and status batching is kept at module level.
     """
+    global _profile, _batch_status_supported
+
+    _batch_status_supported = True
+    _profile = dict.fromkeys(_PROFILE_PHASES, 0.0) if profile else None
+    started = time.perf_counter()
 
     completions = 0
     errors = 0
 
     jobs_in_progress = deque()
-    for job in yield_jobs(jobs_file_path):
-        try:
-            job.info = post_with_retry(api_key, job.request)
-            notify_job_submitted(job)
-            jobs_in_progress.appendleft(job)
-
-            new_completions, new_errors = clean_completed(api_key, jobs_in_progress)
-            completions += new_completions
-            errors += new_errors
-        except requests.HTTPError as e:
-            errors += 1
-            handle_error(e.response)
+    session = _new_session(http2=True) if http2 else _session
+    try:
+        with ThreadPoolExecutor(max_workers=_STATUS_WORKERS) as executor, \
+                ThreadPoolExecutor(max_workers=_SUBMIT_WORKERS) as submitter:
+            # Keep a bounded number of submissions in flight while the CSV is still being read.
+            submissions: Dict[Future, Job] = {}
+            last_sweep = time.monotonic()
+            try:
+                for job in _timed_iter(yield_jobs(jobs_file_path), 'csv_read'):
+                    submissions[submitter.submit(post_with_retry, api_key, job.request, session)] = job
+                    if len(submissions) < _MAX_PENDING_SUBMISSIONS:
+                        continue
+
+                    done, _ = wait(submissions, return_when=FIRST_COMPLETED)
+                    errors += collect_submitted(done, submissions, jobs_in_progress)
+                    if time.monotonic() - last_sweep < _POLL_INTERVAL:
+                        continue  # don't check status more often than the drain loop below does
+                    last_sweep = time.monotonic()
+                    new_completions, new_errors = clean_completed(api_key, jobs_in_progress, executor, session)
+                    completions += new_completions
+                    errors += new_errors
+
+                errors += collect_submitted(as_completed(list(submissions)), submissions, jobs_in_progress)
+            except BaseException:
+                # Don't submit jobs that haven't started yet; leaving the block would otherwise wait for all of them.
+                for future in submissions:
+                    future.cancel()
+                raise
 
-    # All jobs submitted. Now wait for the last of them to finish.
-    while jobs_in_progress:
-        new_completions, new_errors = clean_completed(api_key, jobs_in_progress)
-        completions += new_completions
-        errors += new_errors
-        time.sleep(10.0)
+            # All jobs submitted. Now wait for the last of them to finish, backing off while nothing changes.
+            interval = _POLL_INTERVAL
+            while jobs_in_progress:
+                new_completions, new_errors = clean_completed(api_key, jobs_in_progress, executor, session)
+                completions += new_completions
+                errors += new_errors
+                if not jobs_in_progress:
+                    break
+                interval = _next_interval(interval, new_completions + new_errors > 0)
+                with _timed('status_wait_sleep'):
+                    time.sleep(_jittered(interval))
+    finally:
+        session.close()
+        profiled, _profile = _profile, None
 
     print('\nResults:')
     print(f'\nJobs run: {completions + errors}, Errors: {errors}')
+    if profiled is not None:
+        _print_profile(profiled, time.perf_counter() - started)
+
+
+def _print_profile(profiled: Dict[str, float], wall_time: float):
+    """ Print the time spent in each phase of ``run_jobs``, slowest first """
+    total = sum(profiled.values()) or 1.0
+    print('\nProfile (seconds summed across threads):\n')
+    for phase, seconds in sorted(profiled.items(), key=lambda item: item[1], reverse=True):
+        print(f'{phase:<18} {seconds:10.3f}s {100 * seconds / total:6.1f}%')
+    print(f'{"wall time":<18} {wall_time:10.3f}s')
+
+
+class _PhaseTimer:
+    """ Adds the time spent in a ``with`` block to ``phase`` in ``_profile`` """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        with _profile_lock:
+            if _profile is not None:
+                _profile[self.phase] += elapsed
+
+
+_NOT_TIMED = nullcontext()
+
+
+def _timed(phase: str):
+    """ Time a ``with`` block under ``phase`` when profiling, else return a shared no-op context """
+    return _NOT_TIMED if _profile is None else _PhaseTimer(phase)
+
+
+def _timed_iter(items: Iterable[_T], phase: str) -> Iterable[_T]:
+    """ Time each step of ``items`` under ``phase`` when profiling, but not the caller's work in between """
+    if _profile is None:
+        return items
+    return _timed_steps(items, phase)
+
+
+def _timed_steps(items: Iterable[_T], phase: str) -> Generator[_T, None, None]:
+    items = iter(items)
+    while True:
+        with _timed(phase):
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+        yield item
 
 
 def yield_jobs(jobs_file_path: str) -> Generator[Job, None, None]:
@@ -109,19 +378,58 @@ def yield_jobs(jobs_file_path: str) -> Generator[Job, None, None]:
         Each record from the jobs CSV translated to a ``Job``
     """
 
-    with open(jobs_file_path) as jobs_file:
-        jobs_csv = csv.DictReader(jobs_file, skipinitialspace=True)
-        for index, row in enumerate(jobs_csv):
-            row_number = index + 1
-            request = to_request(row)
-            yield Job(row_number, request)
+    with open(jobs_file_path, newline='', encoding='utf-8') as jobs_file:
+        jobs_csv = csv.reader(jobs_file, skipinitialspace=True)
+        header = next(jobs_csv, None)
+        if header is None:
+            return  # empty file, no jobs
+        header = [normalize_key(k) for k in header]
+        missing = [field for field in ArchiveRequest._fields if field not in header]
+        if missing:
+            raise ValueError(f'Jobs CSV header is missing: {", ".join(missing)}')
+        columns = [header.index(field) for field in ArchiveRequest._fields]
+
+        row_number = 0
+        for row in jobs_csv:
+            if not row:
+                continue  # skip blank lines, as csv.DictReader does
+            if len(row) < len(header):
+                row += [None] * (len(header) - len(row))  # pad short rows, as csv.DictReader does
+            row_number += 1
+            yield Job(row_number, ArchiveRequest(*[row[i] for i in columns]))
+
+
+def collect_submitted(futures: Iterable[Future], submissions: Dict[Future, Job], jobs: Deque[Job]) -> int:
+    """ Move each submitted job from ``submissions`` into ``jobs``
+    Args:
+        futures: Finished futures returned by submitting ``post_with_retry``
+        submissions: The pending submissions, keyed by future
+        jobs: A deque of active jobs
+
+    Returns:
+        The number of jobs that could not be submitted
+    """
+
+    error_count = 0
+    for future in futures:
+        job = submissions.pop(future)
+        try:
+            job.info = future.result()
+        except requests.HTTPError as e:
+            error_count += 1
+            handle_error(e.response)
+            continue
+        notify_job_submitted(job)
+        jobs.appendleft(job)
+    return error_count
 
 
-def post_with_retry(api_key: str, req: ArchiveRequest) -> Dict[str, Any]:
+def post_with_retry(api_key: str, req: ArchiveRequest, session: _Session = None) -> Dict[str, Any]:
     """ Submit an ``ArchiveRequest`` to HoD Archive while handling the 429 backpressure
     Args:
         api_key: The api key to use
         req: The ``ArchiveRequest`` to submit
+        session: The session to send the request with, if not the module's shared session
 
     Returns:
         The job info returned by the HoD Archive API
@@ -130,21 +438,52 @@ def post_with_retry(api_key: str, req: ArchiveRequest) -> Dict[str, Any]:
         requests.HTTPError
     """
 
+    interval = None
     while True:
         try:
-            return post(api_key, req)
+            return post(api_key, req, session)
         except requests.HTTPError as e:
-            if e.response.status_code == 429:
-                time.sleep(int(e.response.headers.get('Retry-After', '10')))
-            else:
+            if e.response.status_code != 429:
                 raise
+            retry_after = e.response.headers.get('Retry-After')
+            with _timed('post_retry_wait'):
+                if retry_after is not None:
+                    time.sleep(int(retry_after))
+                else:
+                    interval = _POLL_INTERVAL if interval is None else _next_interval(interval, False)
+                    time.sleep(_jittered(interval))
+
+
+def _next_interval(interval: float, progressed: bool) -> float:
+    """ Reset the wait interval if anything progressed, else grow it exponentially up to the cap """
+    if progressed:
+        return _POLL_INTERVAL
+    return min(interval * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+
+
+def _jittered(interval: float) -> float:
+    """ Randomize ``interval`` by +/- ``_JITTER`` so concurrent clients don't poll in lockstep """
+    return interval * random.uniform(1 - _JITTER, 1 + _JITTER)
+
+
+@lru_cache(maxsize=16)
+def _archive_url(api_key: str) -> str:
+    """ The archive URL with ``api_key`` already quoted into its query string """
+    return f'{_HOD_ARCHIVE_URL}?apiKey={quote(api_key, safe="")}'
 
 
-def post(api_key: str, req: ArchiveRequest) -> Dict[str, Any]:
+@lru_cache(maxsize=16)
+def _activity_url_prefix(api_key: str) -> str:
+    """ The activity URL with ``api_key`` already quoted into its query string, ready for a ``jobId`` to be appended """
+    return f'{_HOD_ACTIVITY_URL}?apiKey={quote(api_key, safe="")}&jobId='
+
+
+def post(api_key: str, req: ArchiveRequest, session: _Session = None) -> Dict[str, Any]:
     """ Submit an ``ArchiveRequest`` to HoD Archive.
     Args:
         api_key: The api key to use
         req: The ``ArchiveRequest`` to submit
+        session: The session to send the request with, if not the module's shared session
 
     Returns:
         The job info returned by the HoD Archive API
@@ -153,83 +492,153 @@ def post(api_key: str, req: ArchiveRequest) -> Dict[str, Any]:
         requests.HTTPError
     """
 
-    params = {'apiKey': api_key}
-    response = requests.post(
-        _HOD_ARCHIVE_URL,
-        headers={'Content-Type': 'application/json'},
-        params=params,
-        data=json.dumps({
-            'location': req.location,
-            'startDateTime': req.start_date_time,
-            'endDateTime': req.end_date_time,
-            'format': req.format,
-            'units': req.units,
-            'resultsLocation': req.results_location
-        }))
+    with _timed('post'):
+        response = (session or _session).post(
+            _archive_url(api_key),
+            data=_json_dumps(dict(zip(_REQUEST_BODY_KEYS, _request_values(req)))))
     response.raise_for_status()  # raise error if one occurred
     body = read_response_body(response)
     return body['job']
 
 
-def clean_completed(api_key: str, jobs: Deque[Job]):
+def clean_completed(api_key: str, jobs: Deque[Job], executor: Executor, session: _Session = None):
     """ Update each job's status and clear completed jobs
     Args:
         api_key: The api key to use
         jobs: A deque of active jobs
+        executor: The executor used to check the status of jobs concurrently when they can't be checked in one batch
+        session: The session to send requests with, if not the module's shared session
+
+    Returns:
+        The number of jobs that completed and errored. A status check rejected with a 4xx (other than 429) counts as an
+        error for that job. Jobs whose status check failed transiently (5xx, 429, connection errors) are reported and
+        stay in ``jobs`` to be checked again on the next sweep.
     """
 
+    statuses = _get_batched_statuses(api_key, jobs, session)
+    futures = {
+        job.info['jobId']: executor.submit(get_status, api_key, job.info['jobId'], job.info, session)
+        for job in jobs if job.info['jobId'] not in statuses
+    }
+
     complete_count = 0
     error_count = 0
-    for i in range(len(jobs)):
-        job = jobs.pop()  # pop right
-        job.info = get_status(api_key, job.info['jobId'])
-        if 'complete' == job.info['jobStatus']:
+    still_running = deque()
+    for job in jobs:
+        job_id = job.info['jobId']
+        try:
+            job.info = statuses[job_id] if job_id in statuses else futures[job_id].result()
+        except requests.HTTPError as e:
+            handle_error(e.response)
+            if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
+                error_count += 1  # the check will never succeed, so stop tracking the job
+            else:
+                still_running.append(job)
+            continue
+        except requests.RequestException as e:
+            print(f'Error checking job ({job_id}): {e}')
+            still_running.append(job)
+            continue
+        status = job.info['jobStatus']
+        if 'complete' == status:
             complete_count += 1
             notify_job_complete(job)
-        elif 'error' == job.info['jobStatus']:
+        elif 'error' == status:
             error_count += 1
             notify_job_errored(job)
         else:
-            jobs.appendleft(job)
+            still_running.append(job)
+    jobs.clear()
+    jobs.extend(still_running)
     return complete_count, error_count
 
 
-def get_status(api_key: str, job_id: str) -> Dict[str, Any]:
+def _get_batched_statuses(api_key: str, jobs: Deque[Job], session: _Session = None) -> Dict[str, Dict[str, Any]]:
+    """ Get the status of ``jobs`` in batches of ``_STATUS_BATCH_SIZE``, as far as the API supports batched lookups.
+    Jobs missing from the result are left for ``clean_completed`` to check one at a time.
+    """
+    global _batch_status_supported
+
+    if not _batch_status_supported:
+        return {}
+    job_ids = [job.info['jobId'] for job in jobs]
+    statuses = {}
+    for start in range(0, len(job_ids), _STATUS_BATCH_SIZE):
+        batch = job_ids[start:start + _STATUS_BATCH_SIZE]
+        if len(batch) < 2:
+            break  # a single ID is an ordinary lookup, which doesn't return a list
+        try:
+            statuses.update(get_statuses(api_key, batch, session))
+        except requests.HTTPError as e:
+            if e.response.status_code in (400, 404, 414):
+                _batch_status_supported = False
+            break  # any other failure is transient; fall back to per-job checks for this sweep
+        except requests.RequestException:
+            break  # connection errors and timeouts are transient too
+        except ValueError:
+            _batch_status_supported = False
+            break
+    return statuses
+
+
+def get_status(api_key: str, job_id: str, previous: Dict[str, Any] = None,
+               session: _Session = None) -> Dict[str, Any]:
     """ Get the status of a submitted job.
     Args:
         api_key: The api key to use
         job_id: The ID of the job to check
+        previous: The status last returned for this job. If it carries an ETag, the status is only fetched again if
+         it has changed.
+        session: The session to send the request with, if not the module's shared session
 
     Returns:
-        The returned job status
+        The returned job status, or ``previous`` if it hasn't changed
     """
 
-    params = {'apiKey': api_key, 'jobId': job_id}
-    response = requests.get(
-        _HOD_ACTIVITY_URL,
-        headers={'Content-Type': 'application/json'},
-        params=params
-    )
+    url = _activity_url_prefix(api_key) + quote(job_id, safe='')
+    etag = previous.get('_etag') if previous else None
+    headers = {'If-None-Match': etag} if etag else None
+    with _timed('status_get'):
+        response = (session or _session).get(url, headers=headers)
+    if response.status_code == 304 and etag:
+        return previous
     response.raise_for_status()  # raise error if one occurred
-    return read_response_body(response)
+    info = read_response_body(response)
+    etag = response.headers.get('ETag')
+    if etag and isinstance(info, dict):
+        info['_etag'] = etag
+    return info
 
 
-def to_request(row: dict) -> ArchiveRequest:
-    """ Convert a CSV record to an ``ArchiveRequest`` """
-    normalized_row = {}
-    for k, v in row.items():
-        normalized_row[normalize_key(k)] = v
-    return ArchiveRequest(**normalized_row)
+def get_statuses(api_key: str, job_ids: List[str], session: _Session = None) -> Dict[str, Dict[str, Any]]:
+    """ Get the status of several submitted jobs with a single request.
+    Args:
+        api_key: The api key to use
+        job_ids: The IDs of the jobs to check
+        session: The session to send the request with, if not the module's shared session
+
+    Returns:
+        The returned job statuses, keyed by job ID
+
+    Raises:
+        requests.HTTPError
+        ValueError - if the response is not a list of job statuses
+    """
+
+    url = _activity_url_prefix(api_key) + quote(','.join(job_ids), safe='')
+    with _timed('status_get'):
+        response = (session or _session).get(url)
+    response.raise_for_status()  # raise error if one occurred
+    body = read_response_body(response)
+    if not isinstance(body, list) or not all(isinstance(info, dict) and 'jobId' in info for info in body):
+        raise ValueError(f'Expected a list of job statuses, got: {body}')
+    return {info['jobId']: info for info in body}
 
 
 def normalize_key(key: str):
     """ Normalize CSV header values """
-    key = key.lower().replace('_', '').replace('-', '').replace(' ', '')
-    return {
-        'startdatetime': 'start_date_time',
-        'enddatetime': 'end_date_time',
-        'resultslocation': 'results_location'
-    }.get(key, key)
+    key = key.lower().translate(_KEY_STRIP_TABLE)
+    return _KEY_MAP.get(key, key)
 
 
 def handle_error(response: requests.Response):
@@ -240,12 +649,12 @@ def handle_error(response: requests.Response):
 
 def read_response_body(response: requests.Response) -> Union[Dict[str, Any], str]:
     """ Read response body as a ``dict`` if possible, else as a ``str`` """
-    body = response.content.decode('utf-8')
+    if not response.content:
+        return None
     try:
-        body = json.loads(body) if response.content else None
-    except json.decoder.JSONDecodeError:
-        pass
-    return body
+        return _json_loads(response.content)
+    except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
+        return response.content.decode('utf-8')
 
 
 def notify_job_submitted(job: Job):
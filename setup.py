@@ -31,6 +31,10 @@ setup(
     packages=find_packages(exclude=['sampledata*']),
     python_requires='>=3.7',
     install_requires=requires,
+    extras_require={
+        'orjson': ['orjson>=3'],
+        'http2': ['httpx[http2]>=0.18']
+    },
     project_urls={
         'Documentation': 'https://ibm.co/2YEa7Q1',
         'Source': 'https://github.com/IBM/hod-archive-sdk-python'